@@ -26,10 +26,95 @@
 #  ___________________________________________________________________________
 
 
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+import logging
+
 import numpy as np
 import pyomo.common.unittest as unittest
 from pyomo.contrib.doe.example.reactor_kinetics import create_model, disc_for_measure
-from pyomo.contrib.doe import Measurements, DesignOfExperiments
+from pyomo.contrib.doe import Measurements, DesignOfExperiments, GridSearchResult
+
+logger = logging.getLogger(__name__)
+
+
+def _compute_grid_point(doe_kwargs, design_values, mode):
+    """Compute the FIM of a single grid point.
+
+    This runs in a worker process, so a fresh DesignOfExperiments object is
+    built from the (picklable) constructor arguments in doe_kwargs.
+
+    Returns the FisherResults object, or None if the solve failed.
+    """
+    doe_object = DesignOfExperiments(**doe_kwargs)
+    try:
+        result = doe_object.compute_FIM(design_values, mode=mode, tee_opt=False)
+        result.calculate_FIM(doe_object.design_values)
+    except:
+        logger.warning(':::::::::::Warning: Cannot converge this run.::::::::::::')
+        return None
+    return result
+
+
+def _design_key(design_values, mode):
+    """Return a hashable key identifying one FIM evaluation.
+
+    Values are rounded so that points reached through different float
+    arithmetic (e.g. np.linspace vs. literals) share the same key.
+    """
+    return (mode,) + tuple(
+        (name, tuple((t, round(float(v), 9)) for t, v in sorted(val.items())))
+        for name, val in sorted(design_values.items())
+    )
+
+
+def _run_grid_search(
+    doe_kwargs,
+    design_values,
+    design_ranges,
+    design_dimension_names,
+    design_control_time,
+    mode,
+    fim_cache=None,
+):
+    """Parallel equivalent of DesignOfExperiments.run_grid_search.
+
+    Every grid point is an independent square solve, so each one is
+    submitted to a process pool and the results are collected into the same
+    GridSearchResult object that run_grid_search returns.
+
+    fim_cache is an optional ``dict`` of previously computed results, keyed
+    by _design_key. It is updated in place, so it can be shared between
+    searches that use the same doe_kwargs to avoid re-solving repeated points.
+    """
+    if fim_cache is None:
+        fim_cache = {}
+
+    point_keys = {}
+    with ProcessPoolExecutor() as executor:
+        futures = {}
+        for design_set_iter in product(*design_ranges):
+            # each point needs its own copy, as it is pickled asynchronously
+            design_iter = {name: dict(val) for name, val in design_values.items()}
+            for i, name in enumerate(design_dimension_names):
+                for t in design_control_time[i]:
+                    design_iter[name][t] = design_set_iter[i]
+
+            key = _design_key(design_iter, mode)
+            point_keys[design_set_iter] = key
+            if key not in fim_cache and key not in futures:
+                futures[key] = executor.submit(
+                    _compute_grid_point, doe_kwargs, design_iter, mode
+                )
+
+        for key, f in futures.items():
+            fim_cache[key] = f.result()
+
+    result_combine = {point: fim_cache[key] for point, key in point_keys.items()}
+
+    return GridSearchResult(
+        design_ranges, design_dimension_names, design_control_time, result_combine
+    )
 
 
 def main():
@@ -66,13 +151,10 @@ def main():
         CA0: CA0 value
         T: A list of T
         """
-        assert len(t_set) == len(T), 'T should have the same length as t_set'
+        if len(t_set) != len(T):
+            raise ValueError('T should have the same length as t_set')
 
-        T_con_initial = {}
-        for t, tim in enumerate(t_set):
-            T_con_initial[tim] = T[t]
-
-        dv_dict_overall = {'CA0': {0: CA0}, 'T': T_con_initial}
+        dv_dict_overall = {'CA0': {0: CA0}, 'T': dict(zip(t_set, T))}
         return dv_dict_overall
 
     # Design variable ranges as lists
@@ -97,23 +179,31 @@ def main():
     else:
         args_ = [True]
 
-    # add prior information
-    prior_all = np.zeros((4, 4))
-
-    prior_pass = np.asarray(prior_all)
+    # empty prior, shared by both grid searches below
+    prior_pass = np.zeros((4, 4))
 
-    doe_object = DesignOfExperiments(
-        parameter_dict,
-        dv_pass,
-        measure_class,
-        createmod,
+    doe_kwargs = dict(
+        param_init=parameter_dict,
+        design_variable_timepoints=dv_pass,
+        measurement_object=measure_class,
+        create_model=createmod,
         prior_FIM=prior_pass,
         discretize_model=disc,
         args=args_,
     )
 
-    all_fim = doe_object.run_grid_search(
-        exp1, design_ranges, dv_apply_name, dv_apply_time, mode=sensi_opt
+    # FIMs computed so far; both searches below use the same model setup,
+    # so points they have in common are only solved once
+    fim_cache = {}
+
+    all_fim = _run_grid_search(
+        doe_kwargs,
+        exp1,
+        design_ranges,
+        dv_apply_name,
+        dv_apply_time,
+        mode=sensi_opt,
+        fim_cache=fim_cache,
     )
 
     test = all_fim.extract_criteria()
@@ -144,18 +234,16 @@ def main():
     else:
         args_ = [True]
 
-    doe_object = DesignOfExperiments(
-        parameter_dict,
-        dv_pass,
-        measure_class,
-        createmod,
-        prior_FIM=prior_pass,
-        discretize_model=disc,
-        args=args_,
-    )
+    doe_kwargs = dict(doe_kwargs, args=args_)
 
-    all_fim = doe_object.run_grid_search(
-        exp1, design_ranges, dv_apply_name, dv_apply_time, mode=sensi_opt
+    all_fim = _run_grid_search(
+        doe_kwargs,
+        exp1,
+        design_ranges,
+        dv_apply_name,
+        dv_apply_time,
+        mode=sensi_opt,
+        fim_cache=fim_cache,
     )
 
     test = all_fim.extract_criteria()
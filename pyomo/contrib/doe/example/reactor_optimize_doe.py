@@ -65,13 +65,10 @@ def main():
         CA0: CA0 value
         T: A list of T
         """
-        assert len(t_set) == len(T), 'T should have the same length as t_set'
+        if len(t_set) != len(T):
+            raise ValueError('T should have the same length as t_set')
 
-        T_con_initial = {}
-        for t, tim in enumerate(t_set):
-            T_con_initial[tim] = T[t]
-
-        dv_dict_overall = {'CA0': {0: CA0}, 'T': T_con_initial}
+        dv_dict_overall = {'CA0': {0: CA0}, 'T': dict(zip(t_set, T))}
         return dv_dict_overall
 
     # prior
@@ -24,9 +24,8 @@ except ImportError:
 
 
 def clean_up_global_state():
-    # Best efforts to dispose any gurobipy objects from previous tests
-    # which might keep the default environment active
-    gc.collect()
+    # Dispose the default environment directly. Garbage collection of
+    # leftover gurobipy objects is done once per test, in tearDown.
     gp.disposeDefaultEnv()
     # Reset flag to sync with default env state
     GurobiDirect._default_env_started = False
@@ -50,6 +49,11 @@ def single_use_license():
         return False
 
 
+# Starting environments is expensive (and may need a license server round
+# trip), so only check the license type once per test module
+using_single_use_license = single_use_license()
+
+
 class GurobiBase(unittest.TestCase):
     # Base class ensures the global environment is cleaned up
 
@@ -65,6 +69,9 @@ class GurobiBase(unittest.TestCase):
         self.model = model
 
     def tearDown(self):
+        # Best efforts to dispose any gurobipy objects from this test which
+        # might keep the default environment active
+        gc.collect()
         clean_up_global_state()
 
 
@@ -259,7 +266,7 @@ class GurobiEnvironmentTests(GurobiBase):
             with self.assertRaises(gp.GurobiError):
                 use_env.start()
 
-    @unittest.skipIf(single_use_license(), reason="test requires multi-use license")
+    @unittest.skipIf(using_single_use_license, reason="test requires multi-use license")
     def test_multiple_solvers_managed(self):
         # Multiple managed solvers will create their own envs
 
@@ -282,7 +289,7 @@ class GurobiEnvironmentTests(GurobiBase):
             results2 = opt2.solve(self.model)
             self.assert_optimal_result(results2)
 
-    @unittest.skipIf(single_use_license(), reason="test requires multi-use license")
+    @unittest.skipIf(using_single_use_license, reason="test requires multi-use license")
     def test_managed_env(self):
         # Test that manage_env=True creates its own environment
 
@@ -318,7 +325,7 @@ class GurobiEnvironmentTests(GurobiBase):
 
 
 @unittest.skipIf(not gurobipy_available, "gurobipy is not available")
-@unittest.skipIf(not single_use_license(), reason="test needs a single use license")
+@unittest.skipIf(not using_single_use_license, reason="test needs a single use license")
 class GurobiSingleUseTests(GurobiBase):
     # Integration tests for Gurobi single-use licenses (useful for checking all Gurobi
     # environments were correctly freed). These tests are not run in pyomo's CI. Each